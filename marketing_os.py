@@ -14,11 +14,20 @@ Usage:
 """
 
 import argparse
-import hashlib
+import bisect
+import functools
+import heapq
+import io
+import itertools
+import re
 import sys
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import NamedTuple
 
 import yaml
 
@@ -38,19 +47,40 @@ try:
 except ImportError:
     APIFY_AVAILABLE = False
 
+# Fast JSON parser (optional, speeds up YouTube response parsing)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Aho-Corasick matcher (optional, speeds up scoring)
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
 
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def get_project_root() -> Path:
     """Get the Marketing OS project root (parent of Scripts folder)."""
     return Path(__file__).parent.parent
 
 
+@functools.lru_cache(maxsize=None)
 def load_config() -> dict:
-    """Load configuration from ../config.yaml"""
+    """Load configuration from ../config.yaml (parsed once per process)"""
     config_path = get_project_root() / "config.yaml"
 
     if not config_path.exists():
@@ -58,23 +88,26 @@ def load_config() -> dict:
         sys.exit(1)
 
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YAML_LOADER)
 
 
-def load_queries(platform: str) -> list:
-    """Load active queries from ../queries/{platform}.yaml"""
+@functools.lru_cache(maxsize=None)
+def load_queries(platform: str) -> tuple:
+    """Load active queries from ../queries/{platform}.yaml (parsed once per process)"""
     queries_path = get_project_root() / "queries" / f"{platform}.yaml"
 
     if not queries_path.exists():
-        return []
+        return ()
 
     with open(queries_path) as f:
-        data = yaml.safe_load(f) or {}
-        return data.get("active", [])
+        data = yaml.load(f, Loader=YAML_LOADER) or {}
+        # Tuple, so callers can't mutate the cached value
+        return tuple(data.get("active", []))
 
 
+@functools.lru_cache(maxsize=None)
 def load_context_file(filename: str) -> str:
-    """Load a context file from ../Context/"""
+    """Load a context file from ../Context/ (read once per process)"""
     context_path = get_project_root() / "Context" / filename
     if context_path.exists():
         return context_path.read_text()
@@ -86,28 +119,13 @@ def load_context_file(filename: str) -> str:
 # =============================================================================
 
 
-def score_post(post: dict, icp_context: str, positioning_context: str) -> dict:
-    """
-    Score a post against ICP criteria.
-    Returns dict with score breakdown and total.
-
-    Scoring dimensions (from MVP Requirements):
-    - ICP Match (30%): Does author/content match Pioneer Advocate profile?
-    - Topic Relevance (25%): How directly related to Autonomi's offering?
-    - Reach Potential (15%): Engagement, follower influence
-    - Timing (15%): Is conversation still active/fresh?
-    - Conversation Stage (15%): Asking questions vs already decided
-    """
-
-    text = post.get("text", "").lower()
-    engagement = post.get("engagement_total", 0)
-    created_at = post.get("created_at", "")
-
-    # --- ICP Match (0-100) ---
-    icp_score = 0
-
+# Terms must be lowercase: the automaton matches them against lowercased text.
+# The regex fallback uses re.IGNORECASE and needs no lowercased copy at all.
+# No term may be a prefix of another term in the same category, or the regex
+# fallback would count fewer matches than the automaton (see TERM_PATTERNS).
+SCORING_TERMS = {
     # High-value language patterns from ICP Profile
-    high_value_terms = [
+    "high_value": (
         "own my data",
         "data sovereignty",
         "self-sovereign",
@@ -125,10 +143,9 @@ def score_post(post: dict, icp_context: str, positioning_context: str) -> dict:
         "the web we were promised",
         "digital rights",
         "data ownership",
-    ]
-
+    ),
     # Question/exploration signals (high value)
-    question_signals = [
+    "question": (
         "is there an alternative",
         "looking for",
         "anyone know",
@@ -139,10 +156,9 @@ def score_post(post: dict, icp_context: str, positioning_context: str) -> dict:
         "tired of",
         "concerned about",
         "worried about",
-    ]
-
+    ),
     # Lower value signals
-    low_value_terms = [
+    "low_value": (
         "token price",
         "to the moon",
         "nft",
@@ -152,25 +168,9 @@ def score_post(post: dict, icp_context: str, positioning_context: str) -> dict:
         "b2b",
         "roi",
         "kpi",
-    ]
-
-    # Calculate ICP match
-    high_matches = sum(1 for term in high_value_terms if term in text)
-    question_matches = sum(1 for term in question_signals if term in text)
-    low_matches = sum(1 for term in low_value_terms if term in text)
-
-    icp_score = min(100, (high_matches * 20) + (question_matches * 25))
-    icp_score = max(0, icp_score - (low_matches * 30))
-
-    # Baseline for matching our search terms at all
-    if icp_score == 0:
-        icp_score = 30  # They matched a query, so some baseline relevance
-
-    # --- Topic Relevance (0-100) ---
-    topic_score = 0
-
+    ),
     # Direct relevance to what Autonomi offers
-    direct_relevance = [
+    "direct": (
         "decentralized storage",
         "encrypted storage",
         "private storage",
@@ -181,10 +181,9 @@ def score_post(post: dict, icp_context: str, positioning_context: str) -> dict:
         "serverless",
         "permanent storage",
         "censorship resistant",
-    ]
-
+    ),
     # Adjacent/comparative topics
-    adjacent_topics = [
+    "adjacent": (
         "ipfs",
         "filecoin",
         "storj",
@@ -199,93 +198,282 @@ def score_post(post: dict, icp_context: str, positioning_context: str) -> dict:
         "aws",
         "azure",
         "cloud costs",
-    ]
+    ),
+    # Conversation stage: questions and exploration
+    "stage_question": ("?", "anyone", "looking for", "recommendations", "trying to"),
+    # Conversation stage: statements of frustration
+    "stage_frustration": ("frustrated", "tired of", "hate", "annoyed", "sick of"),
+    # Conversation stage: already decided/using something
+    "stage_decided": ("i use", "switched to", "moved to", "loving"),
+}
+
+
+def build_term_matcher():
+    """Build one Aho-Corasick automaton covering every scoring term."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
 
-    direct_matches = sum(1 for term in direct_relevance if term in text)
-    adjacent_matches = sum(1 for term in adjacent_topics if term in text)
+    categories_by_term = {}
+    for category, terms in SCORING_TERMS.items():
+        for term in terms:
+            categories_by_term.setdefault(term, []).append(category)
 
-    topic_score = min(100, (direct_matches * 30) + (adjacent_matches * 15))
-    if topic_score == 0:
-        topic_score = 25  # Baseline for matching search query
+    automaton = ahocorasick.Automaton()
+    for term, categories in categories_by_term.items():
+        automaton.add_word(term, (term, tuple(categories)))
+    automaton.make_automaton()
+    return automaton
 
-    # --- Reach Potential (0-100) ---
-    reach_score = 0
-
-    if engagement >= 100:
-        reach_score = 100
-    elif engagement >= 50:
-        reach_score = 80
-    elif engagement >= 20:
-        reach_score = 60
-    elif engagement >= 10:
-        reach_score = 40
-    elif engagement >= 5:
-        reach_score = 25
-    else:
-        reach_score = 10
 
-    # --- Timing (0-100) ---
-    timing_score = 80  # Default to good timing since we're searching recent
+def check_scoring_terms():
+    """Fail fast if a category holds a term that is a prefix of another."""
+    for category, terms in SCORING_TERMS.items():
+        for term in terms:
+            for other in terms:
+                if other != term and other.startswith(term):
+                    raise ValueError(
+                        f"SCORING_TERMS[{category!r}]: {term!r} is a prefix of "
+                        f"{other!r}, so the regex fallback would miss a match"
+                    )
 
-    # Could enhance with actual timestamp comparison
+
+check_scoring_terms()
+
+TERM_MATCHER = build_term_matcher()
+
+# Fallback when pyahocorasick is missing: one compiled alternation per category.
+# The lookahead tries a match at every position, so overlapping terms that
+# start at different positions (e.g. "own my data sovereignty") are all found.
+# Only one term can match per start position, which is why SCORING_TERMS must
+# not contain prefix pairs (checked by check_scoring_terms below).
+TERM_PATTERNS = {
+    category: re.compile("(?=(" + "|".join(map(re.escape, terms)) + "))", re.IGNORECASE)
+    for category, terms in SCORING_TERMS.items()
+}
+
+
+def count_term_matches(text: str) -> dict:
+    """
+    Count how many distinct terms from each SCORING_TERMS category appear in text.
+    Matching is case-insensitive. Uses a single automaton pass when
+    pyahocorasick is installed.
+    """
+    if TERM_MATCHER is None:
+        return {
+            category: len({m.lower() for m in pattern.findall(text)})
+            for category, pattern in TERM_PATTERNS.items()
+        }
+
+    counts = dict.fromkeys(SCORING_TERMS, 0)
+    seen = set()
+    # The automaton is case-sensitive, so it needs a lowercased copy
+    for _, (term, categories) in TERM_MATCHER.iter(text.lower()):
+        if term in seen:
+            continue
+        seen.add(term)
+        for category in categories:
+            counts[category] += 1
+
+    return counts
+
+
+class Score(NamedTuple):
+    """Score breakdown for one post (a tuple, so much lighter than a dict)."""
+
+    total: int
+    icp_match: int
+    topic_relevance: int
+    reach_potential: int
+    timing: int
+    conversation_stage: int
+
+
+def score_post(post: dict, icp_context: str, positioning_context: str) -> Score:
+    """
+    Score a post against ICP criteria.
+    Returns a Score with the breakdown and total.
+
+    Scoring dimensions (from MVP Requirements):
+    - ICP Match (30%): Does author/content match Pioneer Advocate profile?
+    - Topic Relevance (25%): How directly related to Autonomi's offering?
+    - Reach Potential (15%): Engagement, follower influence
+    - Timing (15%): Is conversation still active/fresh?
+    - Conversation Stage (15%): Asking questions vs already decided
+    """
+
+    text = post.get("text", "")
+    engagement = post.get("engagement_total", 0)
+    created_at = post.get("created_at", "")
+
+    matches = count_term_matches(text)
 
     # --- Conversation Stage (0-100) ---
     stage_score = 50  # Default
 
     # Questions and exploration = high value
-    if any(
-        q in text
-        for q in ["?", "anyone", "looking for", "recommendations", "trying to"]
-    ):
+    if matches["stage_question"]:
         stage_score = 85
     # Statements of frustration = good opportunity
-    elif any(
-        f in text for f in ["frustrated", "tired of", "hate", "annoyed", "sick of"]
-    ):
+    elif matches["stage_frustration"]:
         stage_score = 75
     # Already decided/using something = lower value
-    elif any(d in text for d in ["i use", "switched to", "moved to", "loving"]):
+    elif matches["stage_decided"]:
         stage_score = 30
 
-    # --- Calculate weighted total ---
-    weights = {
-        "icp_match": 0.30,
-        "topic_relevance": 0.25,
-        "reach_potential": 0.15,
-        "timing": 0.15,
-        "conversation_stage": 0.15,
-    }
+    return score_from_counts(
+        matches["high_value"],
+        matches["question"],
+        matches["low_value"],
+        matches["direct"],
+        matches["adjacent"],
+        engagement,
+        stage_score,
+    )
+
+
+# Engagement buckets for reach: <5 -> 10, 5+ -> 25, ... 100+ -> 100
+REACH_CUTS = (5, 10, 20, 50, 100)
+REACH_SCORES = (10, 25, 40, 60, 80, 100)
+
+SCORE_WEIGHTS = {
+    "icp_match": 0.30,
+    "topic_relevance": 0.25,
+    "reach_potential": 0.15,
+    "timing": 0.15,
+    "conversation_stage": 0.15,
+}
+
+
+def score_from_counts(
+    high: int,
+    question: int,
+    low: int,
+    direct: int,
+    adjacent: int,
+    engagement: int,
+    stage_score: int,
+) -> Score:
+    """
+    Turn term match counts, engagement and conversation stage into a score.
+    Pure arithmetic - no text handling - so it can be reused for batches.
+    """
+
+    # --- ICP Match (0-100) ---
+    icp_score = min(100, (high * 20) + (question * 25))
+    icp_score = max(0, icp_score - (low * 30))
+
+    # Baseline for matching our search terms at all
+    if icp_score == 0:
+        icp_score = 30  # They matched a query, so some baseline relevance
+
+    # --- Topic Relevance (0-100) ---
+    topic_score = min(100, (direct * 30) + (adjacent * 15))
+    if topic_score == 0:
+        topic_score = 25  # Baseline for matching search query
+
+    # --- Reach Potential (0-100) ---
+    reach_score = REACH_SCORES[bisect.bisect_right(REACH_CUTS, engagement)]
 
+    # --- Timing (0-100) ---
+    timing_score = 80  # Default to good timing since we're searching recent
+
+    # Could enhance with actual timestamp comparison
+
+    # --- Calculate weighted total ---
     total = (
-        icp_score * weights["icp_match"]
-        + topic_score * weights["topic_relevance"]
-        + reach_score * weights["reach_potential"]
-        + timing_score * weights["timing"]
-        + stage_score * weights["conversation_stage"]
+        icp_score * SCORE_WEIGHTS["icp_match"]
+        + topic_score * SCORE_WEIGHTS["topic_relevance"]
+        + reach_score * SCORE_WEIGHTS["reach_potential"]
+        + timing_score * SCORE_WEIGHTS["timing"]
+        + stage_score * SCORE_WEIGHTS["conversation_stage"]
+    )
+
+    return Score(
+        total=round(total),
+        icp_match=icp_score,
+        topic_relevance=topic_score,
+        reach_potential=reach_score,
+        timing=timing_score,
+        conversation_stage=stage_score,
     )
 
-    return {
-        "total": round(total),
-        "icp_match": icp_score,
-        "topic_relevance": topic_score,
-        "reach_potential": reach_score,
-        "timing": timing_score,
-        "conversation_stage": stage_score,
-    }
 
+PRIORITY_LABELS = ("low", "medium", "high")
 
-def get_priority(score: int, config: dict) -> str:
-    """Determine priority tier based on score."""
+
+def get_priority_cuts(config: dict) -> list:
+    """Read the [medium, high] score thresholds from config (once per run)."""
     thresholds = config.get("scorer", {}).get("thresholds", {})
-    high_threshold = thresholds.get("high", 70)
-    medium_threshold = thresholds.get("medium", 50)
+    return [thresholds.get("medium", 50), thresholds.get("high", 70)]
 
-    if score >= high_threshold:
-        return "high"
-    elif score >= medium_threshold:
-        return "medium"
-    else:
-        return "low"
+
+def get_priority(score: int, cuts: list) -> str:
+    """Determine priority tier based on score and get_priority_cuts()."""
+    return PRIORITY_LABELS[bisect.bisect_right(cuts, score)]
+
+
+def score_posts(posts, icp_context: str, positioning_context: str, config: dict):
+    """
+    Score and prioritise posts one at a time as they arrive from the fetchers.
+    Posts are annotated in place with "score" and "priority" rather than
+    copied, so scoring adds no extra dict per post.
+    """
+    cuts = get_priority_cuts(config)
+
+    for post in posts:
+        post["score"] = score_post(post, icp_context, positioning_context)
+        post["priority"] = get_priority(post["score"].total, cuts)
+        yield post
+
+
+class TopPosts:
+    """Keep only the highest-scoring posts seen so far (a bounded min-heap)."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.heap = []
+        self.count = 0
+
+    def add(self, post: dict):
+        # The negated arrival index makes earlier posts win ties, matching a
+        # stable descending sort, and keeps dicts from ever being compared
+        entry = (post["score"].total, -self.count, post)
+        self.count += 1
+
+        if len(self.heap) < self.size:
+            heapq.heappush(self.heap, entry)
+        else:
+            heapq.heappushpop(self.heap, entry)
+
+    def ranked(self) -> list:
+        """Return the kept posts, best first."""
+        return [post for _, _, post in sorted(self.heap, reverse=True)]
+
+
+# =============================================================================
+# CONCURRENT FETCHING
+# =============================================================================
+
+# Queries are network-bound, so a few run in parallel
+FETCH_WORKERS = 4
+
+
+class RateLimiter:
+    """Space out calls (across threads) so at most one starts per interval."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_start = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_start - now
+            self.next_start = max(now, self.next_start) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
 
 
 # =============================================================================
@@ -314,20 +502,19 @@ def get_bluesky_client(config: dict) -> "BlueskyClient":
 
 
 def bluesky_search(client, query: str, limit: int = 25, lang: str = None) -> list:
-    """Search Bluesky for posts matching a query."""
+    """
+    Search Bluesky for posts matching a query.
+    Errors are raised, not printed, so the caller can report them in order.
+    """
     if client is None:
         return []
 
-    try:
-        params = {"q": query, "limit": min(limit, 100), "sort": "latest"}
-        if lang:
-            params["lang"] = lang
+    params = {"q": query, "limit": min(limit, 100), "sort": "latest"}
+    if lang:
+        params["lang"] = lang
 
-        response = client.app.bsky.feed.search_posts(params)
-        return response.posts if response and response.posts else []
-    except Exception as e:
-        print(f"  Error searching for '{query}': {e}")
-        return []
+    response = client.app.bsky.feed.search_posts(params)
+    return response.posts if response and response.posts else []
 
 
 def extract_bluesky_post(post) -> dict:
@@ -336,14 +523,14 @@ def extract_bluesky_post(post) -> dict:
     if hasattr(post, "record"):
         record = post.record
         author = post.author
-        handle = author.handle if hasattr(author, "handle") else ""
-        uri = post.uri if hasattr(post, "uri") else ""
-        text = record.text if hasattr(record, "text") else ""
-        created_at = record.created_at if hasattr(record, "created_at") else ""
-        likes = post.like_count if hasattr(post, "like_count") else 0
-        replies = post.reply_count if hasattr(post, "reply_count") else 0
-        reposts = post.repost_count if hasattr(post, "repost_count") else 0
-        author_name = author.display_name if hasattr(author, "display_name") else handle
+        handle = getattr(author, "handle", "")
+        uri = getattr(post, "uri", "")
+        text = getattr(record, "text", "")
+        created_at = getattr(record, "created_at", "")
+        likes = getattr(post, "like_count", 0)
+        replies = getattr(post, "reply_count", 0)
+        reposts = getattr(post, "repost_count", 0)
+        author_name = getattr(author, "display_name", handle)
     else:
         record = post.get("record", {})
         author = post.get("author", {})
@@ -357,16 +544,11 @@ def extract_bluesky_post(post) -> dict:
         author_name = author.get("displayName", handle)
 
     post_id = uri.split("/")[-1] if uri else ""
-    web_url = (
-        f"https://bsky.app/profile/{handle}/post/{post_id}"
-        if handle and post_id
-        else ""
-    )
 
+    # The web URL is built by render_url() only for posts that get shown
     return {
         "platform": "bluesky",
         "post_id": post_id,
-        "url": web_url,
         "author_handle": handle,
         "author_name": author_name or handle,
         "text": text,
@@ -378,23 +560,26 @@ def extract_bluesky_post(post) -> dict:
     }
 
 
-def fetch_bluesky(config: dict) -> list:
-    """Fetch all posts from Bluesky matching configured queries."""
+def iter_bluesky(config: dict, seen_ids: set = None):
+    """
+    Yield posts from Bluesky matching configured queries.
+    Posts whose (platform, post_id) key is already in seen_ids are skipped.
+    """
 
     listener_config = config.get("listener", {}).get("bluesky", {})
 
     if not listener_config.get("enabled", False):
         print("Bluesky: Disabled in config")
-        return []
+        return
 
     if not ATPROTO_AVAILABLE:
         print("Bluesky: atproto SDK not installed. Run: pip3 install atproto")
-        return []
+        return
 
     queries = load_queries("bluesky")
     if not queries:
         print("Bluesky: No active queries")
-        return []
+        return
 
     posts_per_query = listener_config.get("posts_per_query", 25)
     language = listener_config.get("language", "en")
@@ -405,31 +590,41 @@ def fetch_bluesky(config: dict) -> list:
     client = get_bluesky_client(config)
     if client is None:
         print("Bluesky: Authentication failed")
-        return []
+        return
 
-    # Fetch posts
-    all_posts = []
-    seen_ids = set()
+    # Fetch posts concurrently, rate limited to one request per 0.3s
+    limiter = RateLimiter(0.3)
+
+    def search(query: str) -> list:
+        limiter.wait()
+        return bluesky_search(client, query, limit=posts_per_query, lang=language)
 
-    for i, query in enumerate(queries, 1):
-        print(f"  [{i}/{len(queries)}] {query}", end=" ")
+    if seen_ids is None:
+        seen_ids = set()
 
-        posts = bluesky_search(client, query, limit=posts_per_query, lang=language)
-        print(f"-> {len(posts)} posts")
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = [executor.submit(search, query) for query in queries]
 
-        for post in posts:
-            extracted = extract_bluesky_post(post)
-            extracted["matched_query"] = query
+        # Results are consumed in query order, so progress output and
+        # dedup stay deterministic
+        for i, (query, future) in enumerate(zip(queries, futures), 1):
+            try:
+                posts = future.result()
+            except Exception as e:
+                print(f"  [{i}/{len(queries)}] {query} -> ERROR: {e}")
+                continue
 
-            # Deduplicate
-            if extracted["post_id"] not in seen_ids:
-                seen_ids.add(extracted["post_id"])
-                all_posts.append(extracted)
+            print(f"  [{i}/{len(queries)}] {query} -> {len(posts)} posts")
 
-        if i < len(queries):
-            time.sleep(0.3)
+            for post in posts:
+                extracted = extract_bluesky_post(post)
+                extracted["matched_query"] = query
 
-    return all_posts
+                # Deduplicate
+                key = ("bluesky", extracted["post_id"])
+                if key not in seen_ids:
+                    seen_ids.add(key)
+                    yield extracted
 
 
 # =============================================================================
@@ -441,8 +636,30 @@ def fetch_bluesky(config: dict) -> list:
 
 import requests
 from datetime import timedelta
+from requests.adapters import HTTPAdapter
 
 YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
+YOUTUBE_MAX_IDS_PER_CALL = 50  # /videos accepts up to 50 comma-separated IDs
+YOUTUBE_SNIPPET_FIELDS = (
+    "title",
+    "description",
+    "channelTitle",
+    "channelId",
+    "publishedAt",
+)
+
+# One pooled session for all YouTube calls, so TLS connections are reused
+YOUTUBE_SESSION = requests.Session()
+YOUTUBE_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS)
+)
+
+
+def parse_json(response) -> dict:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 def get_published_after_date(listener_config: dict) -> str:
@@ -452,89 +669,114 @@ def get_published_after_date(listener_config: dict) -> str:
     return cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def fetch_youtube(config: dict) -> list:
-    """Fetch YouTube videos matching configured queries via YouTube Data API."""
+def iter_youtube(config: dict, seen_ids: set = None):
+    """
+    Yield YouTube videos matching configured queries via YouTube Data API.
+    Videos whose (platform, post_id) key is already in seen_ids are skipped.
+    """
 
     listener_config = config.get("listener", {}).get("youtube", {})
 
     if not listener_config.get("enabled", False):
         print("YouTube: Disabled in config")
-        return []
+        return
 
     api_key = config.get("youtube", {}).get("api_key", "")
     if not api_key:
         print("YouTube: No API key in config. Get one from Google Cloud Console.")
-        return []
+        return
 
     queries = load_queries("youtube")
     if not queries:
         print("YouTube: No active queries in queries/youtube.yaml")
-        return []
+        return
 
     videos_per_query = listener_config.get("videos_per_query", 10)
 
     print(f"YouTube: {len(queries)} queries, {videos_per_query} videos each")
 
-    all_videos = []
-    seen_ids = set()
+    published_after = get_published_after_date(listener_config)
+    limiter = RateLimiter(0.5)
 
-    for i, query in enumerate(queries, 1):
-        print(f"  [{i}/{len(queries)}] {query}", end=" ")
-
-        try:
-            # Search for videos
-            search_url = f"{YOUTUBE_API_BASE}/search"
-            params = {
-                "key": api_key,
-                "q": query,
-                "part": "snippet",
-                "type": "video",
-                "maxResults": min(videos_per_query, 50),  # API max is 50
-                "order": "date",  # Prioritise recent content
-                "relevanceLanguage": "en",
-                "publishedAfter": get_published_after_date(listener_config),
-            }
+    def search(query: str) -> list:
+        limiter.wait()
+        return youtube_search(api_key, query, videos_per_query, published_after)
 
-            response = requests.get(search_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+    # Collect unique videos across all queries first...
+    found = []
+    if seen_ids is None:
+        seen_ids = set()
 
-            items = data.get("items", [])
-            print(f"-> {len(items)} videos")
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = [executor.submit(search, query) for query in queries]
 
-            # Get video IDs for statistics lookup
-            video_ids = [
-                item["id"]["videoId"]
-                for item in items
-                if "videoId" in item.get("id", {})
-            ]
+        for i, (query, future) in enumerate(zip(queries, futures), 1):
+            try:
+                items = future.result()
+            except Exception as e:
+                print(f"  [{i}/{len(queries)}] {query} -> ERROR: {e}")
+                continue
 
-            # Fetch video statistics (views, likes, comments)
-            stats = {}
-            if video_ids:
-                stats = fetch_youtube_stats(api_key, video_ids)
+            print(f"  [{i}/{len(queries)}] {query} -> {len(items)} videos")
 
             for item in items:
                 video_id = item.get("id", {}).get("videoId", "")
-                if not video_id or video_id in seen_ids:
+                key = ("youtube", video_id)
+                if not video_id or key in seen_ids:
                     continue
 
-                seen_ids.add(video_id)
-                video_data = extract_youtube_video(item, query, stats.get(video_id, {}))
-                all_videos.append(video_data)
+                seen_ids.add(key)
+                found.append((item, query))
 
-        except Exception as e:
-            print(f"-> ERROR: {e}")
-            continue
+    # ...then fetch statistics (views, likes, comments) in as few calls as possible
+    video_ids = [item["id"]["videoId"] for item, _ in found]
+    stats = {}
+    for start in range(0, len(video_ids), YOUTUBE_MAX_IDS_PER_CALL):
+        chunk = video_ids[start : start + YOUTUBE_MAX_IDS_PER_CALL]
+        stats.update(fetch_youtube_stats(api_key, chunk))
 
-        if i < len(queries):
-            time.sleep(0.5)
+    for item, query in found:
+        yield extract_youtube_video(item, query, stats.get(item["id"]["videoId"], {}))
 
-    return all_videos
+
+def youtube_search(
+    api_key: str, query: str, max_results: int, published_after: str
+) -> list:
+    """Search YouTube for videos matching a query."""
+
+    search_url = f"{YOUTUBE_API_BASE}/search"
+    params = {
+        "key": api_key,
+        "q": query,
+        "part": "snippet",
+        "type": "video",
+        "maxResults": min(max_results, 50),  # API max is 50
+        "order": "date",  # Prioritise recent content
+        "relevanceLanguage": "en",
+        "publishedAfter": published_after,
+    }
+
+    response = YOUTUBE_SESSION.get(search_url, params=params, timeout=30)
+    response.raise_for_status()
+    data = parse_json(response)
+
+    # Keep only the fields extract_youtube_video reads, so the rest of the
+    # response (thumbnails, localizations, etags) is not held until scoring
+    return [
+        {
+            "id": item.get("id", {}),
+            "snippet": {
+                field: value
+                for field, value in item.get("snippet", {}).items()
+                if field in YOUTUBE_SNIPPET_FIELDS
+            },
+        }
+        for item in data.get("items", [])
+    ]
 
 
 def fetch_youtube_stats(api_key: str, video_ids: list) -> dict:
-    """Fetch statistics for a list of video IDs."""
+    """Fetch statistics for up to YOUTUBE_MAX_IDS_PER_CALL video IDs."""
 
     stats_url = f"{YOUTUBE_API_BASE}/videos"
     params = {
@@ -544,9 +786,9 @@ def fetch_youtube_stats(api_key: str, video_ids: list) -> dict:
     }
 
     try:
-        response = requests.get(stats_url, params=params, timeout=30)
+        response = YOUTUBE_SESSION.get(stats_url, params=params, timeout=30)
         response.raise_for_status()
-        data = response.json()
+        data = parse_json(response)
 
         result = {}
         for item in data.get("items", []):
@@ -574,9 +816,6 @@ def extract_youtube_video(item: dict, query: str, stats: dict) -> dict:
     channel_id = snippet.get("channelId", "")
     published_at = snippet.get("publishedAt", "")
 
-    url = f"https://www.youtube.com/watch?v={video_id}"
-    channel_url = f"https://www.youtube.com/channel/{channel_id}" if channel_id else ""
-
     views = stats.get("views", 0)
     likes = stats.get("likes", 0)
     comments = stats.get("comments", 0)
@@ -584,7 +823,6 @@ def extract_youtube_video(item: dict, query: str, stats: dict) -> dict:
     return {
         "platform": "youtube",
         "post_id": video_id,
-        "url": url,
         "author_handle": channel_name,
         "author_name": channel_name,
         "text": f"**{title}**\n\n{description}" if description else f"**{title}**",
@@ -596,7 +834,7 @@ def extract_youtube_video(item: dict, query: str, stats: dict) -> dict:
         "reposts": 0,
         "views": views,
         "engagement_total": likes + comments,
-        "channel_url": channel_url,
+        "channel_id": channel_id,
         "matched_query": query,
     }
 
@@ -606,53 +844,74 @@ def extract_youtube_video(item: dict, query: str, stats: dict) -> dict:
 # =============================================================================
 
 
+BRIEFING_MAX_RESULTS = 10
+
+
+def render_url(post: dict) -> str:
+    """
+    Build the web URL for a post.
+    Deferred to briefing time so only the posts actually shown pay for it.
+    """
+    if post["platform"] == "youtube":
+        return f"https://www.youtube.com/watch?v={post['post_id']}"
+
+    handle = post["author_handle"]
+    post_id = post["post_id"]
+    return (
+        f"https://bsky.app/profile/{handle}/post/{post_id}"
+        if handle and post_id
+        else ""
+    )
+
+
 def generate_briefing(
-    scored_posts: list, config: dict, stats: dict, max_results: int = 10
+    top_posts: list,
+    priority_counts: Counter,
+    config: dict,
+    stats: dict,
+    now: datetime,
 ) -> str:
-    """Generate the Daily Briefing markdown content."""
+    """
+    Generate the Daily Briefing markdown content.
+    top_posts is already ranked; priority_counts covers every scored post.
+    """
 
-    now = datetime.now()
     date_str = now.strftime("%Y-%b-%d")
 
-    # Sort all posts by score descending, take top N
-    sorted_posts = sorted(scored_posts, key=lambda x: x["score"]["total"], reverse=True)
-    top_posts = sorted_posts[:max_results]
-
-    # Count priorities in full set
-    high_count = sum(1 for p in scored_posts if p["priority"] == "high")
-    medium_count = sum(1 for p in scored_posts if p["priority"] == "medium")
-    low_count = sum(1 for p in scored_posts if p["priority"] == "low")
+    high_count = priority_counts["high"]
+    medium_count = priority_counts["medium"]
+    low_count = priority_counts["low"]
 
     # Build briefing
-    lines = []
+    buf = io.StringIO()
 
     # Frontmatter
-    lines.append("---")
-    lines.append(f"date: {date_str}")
-    lines.append(f"generated: {now.isoformat()}")
-    lines.append(f"posts_scanned: {stats['total_fetched']}")
-    lines.append(f"showing: {len(top_posts)}")
-    lines.append(f"high_priority_total: {high_count}")
-    lines.append(f"medium_priority_total: {medium_count}")
-    lines.append("status: unreviewed")
-    lines.append("---")
-    lines.append("")
+    buf.write("---\n")
+    buf.write(f"date: {date_str}\n")
+    buf.write(f"generated: {now.isoformat()}\n")
+    buf.write(f"posts_scanned: {stats['total_fetched']}\n")
+    buf.write(f"showing: {len(top_posts)}\n")
+    buf.write(f"high_priority_total: {high_count}\n")
+    buf.write(f"medium_priority_total: {medium_count}\n")
+    buf.write("status: unreviewed\n")
+    buf.write("---\n")
+    buf.write("\n")
 
     # Summary
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(
-        f"Scanned **{stats['total_fetched']}** posts across {stats['platforms']}."
+    buf.write("## Summary\n")
+    buf.write("\n")
+    buf.write(
+        f"Scanned **{stats['total_fetched']}** posts across {stats['platforms']}.\n"
     )
-    lines.append(f"Showing top **{len(top_posts)}** ranked by score.")
-    lines.append("")
+    buf.write(f"Showing top **{len(top_posts)}** ranked by score.\n")
+    buf.write("\n")
     if high_count > 0:
-        lines.append(f"**{high_count}** high-signal posts found in this batch.")
-    lines.append("")
+        buf.write(f"**{high_count}** high-signal posts found in this batch.\n")
+    buf.write("\n")
 
     # Top 10 Posts
-    lines.append("## Top Opportunities")
-    lines.append("")
+    buf.write("## Top Opportunities\n")
+    buf.write("\n")
 
     for i, post in enumerate(top_posts, 1):
         # Priority badge
@@ -664,52 +923,51 @@ def generate_briefing(
         else:
             badge = "Low"
 
-        lines.append(
-            f"### {i}. @{post['author_handle']} — Score: {post['score']['total']} ({badge})"
+        buf.write(
+            f"### {i}. @{post['author_handle']} — Score: {post['score'].total} ({badge})\n"
         )
-        lines.append("")
-        lines.append(
-            f"**{post['author_name']}** · {post['likes']} likes · {post['replies']} replies · {post['reposts']} reposts"
+        buf.write("\n")
+        buf.write(
+            f"**{post['author_name']}** · {post['likes']} likes · {post['replies']} replies · {post['reposts']} reposts\n"
         )
-        lines.append("")
+        buf.write("\n")
         # Full post text (no truncation)
-        lines.append(f"> {post['text']}")
-        lines.append("")
-        lines.append(f"**Matched query:** `{post['matched_query']}`")
-        lines.append(f"**Link:** {post['url']}")
-        lines.append("")
-        lines.append(f"<details><summary>Score breakdown</summary>")
-        lines.append("")
-        lines.append(f"| Dimension | Score |")
-        lines.append(f"|-----------|-------|")
-        lines.append(f"| ICP Match | {post['score']['icp_match']} |")
-        lines.append(f"| Topic Relevance | {post['score']['topic_relevance']} |")
-        lines.append(f"| Reach Potential | {post['score']['reach_potential']} |")
-        lines.append(f"| Timing | {post['score']['timing']} |")
-        lines.append(f"| Conversation Stage | {post['score']['conversation_stage']} |")
-        lines.append("")
-        lines.append("</details>")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        buf.write(f"> {post['text']}\n")
+        buf.write("\n")
+        buf.write(f"**Matched query:** `{post['matched_query']}`\n")
+        buf.write(f"**Link:** {render_url(post)}\n")
+        buf.write("\n")
+        buf.write(f"<details><summary>Score breakdown</summary>\n")
+        buf.write("\n")
+        buf.write(f"| Dimension | Score |\n")
+        buf.write(f"|-----------|-------|\n")
+        buf.write(f"| ICP Match | {post['score'].icp_match} |\n")
+        buf.write(f"| Topic Relevance | {post['score'].topic_relevance} |\n")
+        buf.write(f"| Reach Potential | {post['score'].reach_potential} |\n")
+        buf.write(f"| Timing | {post['score'].timing} |\n")
+        buf.write(f"| Conversation Stage | {post['score'].conversation_stage} |\n")
+        buf.write("\n")
+        buf.write("</details>\n")
+        buf.write("\n")
+        buf.write("---\n")
+        buf.write("\n")
 
     # Stats
-    lines.append("## Run Statistics")
-    lines.append("")
-    lines.append(f"| Metric | Value |")
-    lines.append(f"|--------|-------|")
-    lines.append(f"| Platforms | {stats['platforms']} |")
-    lines.append(f"| Queries run | {stats['queries_run']} |")
-    lines.append(f"| Posts scanned | {stats['total_fetched']} |")
-    lines.append(f"| High signal (70+) | {high_count} |")
-    lines.append(f"| Medium signal (50-69) | {medium_count} |")
-    lines.append(f"| Low signal (<50) | {low_count} |")
-    lines.append("")
-
-    return "\n".join(lines)
-
-
-def save_briefing(content: str, config: dict) -> Path:
+    buf.write("## Run Statistics\n")
+    buf.write("\n")
+    buf.write(f"| Metric | Value |\n")
+    buf.write(f"|--------|-------|\n")
+    buf.write(f"| Platforms | {stats['platforms']} |\n")
+    buf.write(f"| Queries run | {stats['queries_run']} |\n")
+    buf.write(f"| Posts scanned | {stats['total_fetched']} |\n")
+    buf.write(f"| High signal (70+) | {high_count} |\n")
+    buf.write(f"| Medium signal (50-69) | {medium_count} |\n")
+    buf.write(f"| Low signal (<50) | {low_count} |\n")
+
+    return buf.getvalue()
+
+
+def save_briefing(content: str, config: dict, now: datetime) -> Path:
     """Save the daily briefing to the Daily Review folder."""
 
     project_root = get_project_root()
@@ -717,7 +975,6 @@ def save_briefing(content: str, config: dict) -> Path:
     review_path.mkdir(parents=True, exist_ok=True)
 
     # Always include timestamp so each run creates a new file
-    now = datetime.now()
     date_str = now.strftime("%Y-%b-%d")
     time_str = now.strftime("%H%M")
     filename = f"{date_str} - Daily Briefing ({time_str}).md"
@@ -767,47 +1024,49 @@ def main():
         print("=" * 60 + "\n")
         return
 
-    # Fetch posts from enabled platforms
-    all_posts = []
-    platforms_run = []
-    queries_run = 0
+    # Fetch posts from enabled platforms, deduplicating across all of them.
+    # Posts are scored as they stream in; only the top few are kept in memory.
+    seen_ids = set()
+    sources = []
 
     if args.platform in ["bluesky", "all"]:
-        bluesky_posts = fetch_bluesky(config)
-        all_posts.extend(bluesky_posts)
-        if bluesky_posts:
-            platforms_run.append("Bluesky")
-            queries_run += len(load_queries("bluesky"))
+        sources.append(iter_bluesky(config, seen_ids))
 
     if args.platform in ["youtube", "all"]:
-        youtube_videos = fetch_youtube(config)
-        all_posts.extend(youtube_videos)
-        if youtube_videos:
-            platforms_run.append("YouTube")
-            queries_run += len(load_queries("youtube"))
+        sources.append(iter_youtube(config, seen_ids))
 
     # Twitter would go here when enabled
 
-    print(f"\nTotal fetched: {len(all_posts)} unique posts")
+    # Scoring happens as posts stream in, so announce it before fetching starts
+    print("Scoring posts against ICP criteria...")
+    top_posts = TopPosts(BRIEFING_MAX_RESULTS)
+    priority_counts = Counter()
+    platform_counts = Counter()
 
-    if not all_posts:
-        print("No posts found. Check your configuration.")
-        return
+    for post in score_posts(
+        itertools.chain(*sources), icp_context, positioning_context, config
+    ):
+        top_posts.add(post)
+        priority_counts[post["priority"]] += 1
+        platform_counts[post["platform"]] += 1
 
-    # Score all posts
-    print("Scoring posts against ICP criteria...")
-    scored_posts = []
+    total_fetched = top_posts.count
+    print(f"\nTotal fetched: {total_fetched} unique posts")
 
-    for post in all_posts:
-        score = score_post(post, icp_context, positioning_context)
-        priority = get_priority(score["total"], config)
+    if not total_fetched:
+        print("No posts found. Check your configuration.")
+        return
 
-        scored_posts.append({**post, "score": score, "priority": priority})
+    platforms_run = []
+    queries_run = 0
+    for platform, label in [("bluesky", "Bluesky"), ("youtube", "YouTube")]:
+        if platform_counts[platform]:
+            platforms_run.append(label)
+            queries_run += len(load_queries(platform))
 
-    # Count priorities
-    high_count = sum(1 for p in scored_posts if p["priority"] == "high")
-    medium_count = sum(1 for p in scored_posts if p["priority"] == "medium")
-    low_count = sum(1 for p in scored_posts if p["priority"] == "low")
+    high_count = priority_counts["high"]
+    medium_count = priority_counts["medium"]
+    low_count = priority_counts["low"]
 
     print(f"  High: {high_count} | Medium: {medium_count} | Low: {low_count}")
 
@@ -815,14 +1074,19 @@ def main():
     stats = {
         "platforms": ", ".join(platforms_run) if platforms_run else "None",
         "queries_run": queries_run,
-        "total_fetched": len(all_posts),
-        "unique_posts": len(all_posts),
+        "total_fetched": total_fetched,
+        "unique_posts": total_fetched,
     }
 
-    briefing_content = generate_briefing(scored_posts, config, stats)
+    # One timestamp for the run, so the briefing's date and its filename agree
+    now = datetime.now()
+
+    briefing_content = generate_briefing(
+        top_posts.ranked(), priority_counts, config, stats, now
+    )
 
     # Save briefing
-    filepath = save_briefing(briefing_content, config)
+    filepath = save_briefing(briefing_content, config, now)
 
     print(f"\n{'=' * 60}")
     print("COMPLETE")